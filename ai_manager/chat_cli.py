@@ -4,7 +4,9 @@ import argparse
 import json
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 
+import orjson
 from dotenv import load_dotenv
 
 from .content_updater import ContentUpdateError, apply_update
@@ -13,6 +15,10 @@ from .ollama_client import OllamaError, chat, extract_json_object
 from .paths import repo_root
 
 
+# git add/commit/push runs in the background so the prompt returns right after the
+# content write. A single worker keeps git operations ordered.
+_GIT_POOL = ThreadPoolExecutor(max_workers=1)
+
 TOOL_SPEC = {
     "file": "site.json",
     "operation": "replace | append | delete",
@@ -47,25 +53,6 @@ def _build_prompt(user_instruction: str) -> str:
     )
 
 
-def _build_repair_prompt(*, user_instruction: str, bad_output: str) -> str:
-    return (
-        "You returned invalid JSON previously. Repair it.\n"
-        "Return ONLY a single valid JSON object. No markdown, no prose.\n\n"
-        "The JSON MUST match this payload schema exactly:\n"
-        "{\n"
-        "  \"file\": \"site.json\",\n"
-        "  \"operation\": \"replace\" | \"append\" | \"delete\",\n"
-        "  \"content\": { ... }\n"
-        "}\n\n"
-        "Reminder:\n"
-        "- replace: content is the full new JSON for site.json (keys: bio, services, projects, contact)\n"
-        "- append/delete: content has shape {\"section\": <bio|services|projects|contact>, \"data\": {...}}\n\n"
-        f"Original instruction: {user_instruction}\n\n"
-        "Bad output to repair (verbatim):\n"
-        f"{bad_output}\n"
-    )
-
-
 def main(argv: list[str] | None = None) -> int:
     load_dotenv()
 
@@ -78,6 +65,8 @@ def main(argv: list[str] | None = None) -> int:
 
     print("AI website manager (local). Type 'exit' to quit.", file=sys.stderr)
 
+    git_jobs: list[Future] = []
+
     while True:
         try:
             user = input("> ").strip()
@@ -94,35 +83,49 @@ def main(argv: list[str] | None = None) -> int:
                 payload = json.loads(user)
             else:
                 prompt = _build_prompt(user)
-                raw = chat(prompt=prompt, model=args.model, host=args.host)
-                try:
-                    payload = extract_json_object(raw)
-                except OllamaError:
-                    print("Model output wasn't valid JSON; retrying once...", file=sys.stderr)
-                    repair = _build_repair_prompt(user_instruction=user, bad_output=raw)
-                    raw2 = chat(prompt=repair, model=args.model, host=args.host)
-                    payload = extract_json_object(raw2)
+                # format="json" constrains decoding to valid JSON, so no repair round-trip is needed.
+                raw = chat(prompt=prompt, model=args.model, host=args.host, format="json", stream=True)
+                payload = extract_json_object(raw)
 
             result = apply_update(payload)
-            print(json.dumps(result, indent=2), file=sys.stderr)
+            print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode(), file=sys.stderr)
 
             if args.git and result.get("status") == "ok":
                 rel_path = f"website/content/{result['file']}"
-                git_result = stage_commit_push(
-                    repo_root=str(repo_root()),
-                    paths=[rel_path],
-                    message=f"AI update: {result['file']} ({result['operation']})",
+                git_jobs.append(
+                    _GIT_POOL.submit(
+                        stage_commit_push,
+                        repo_root=str(repo_root()),
+                        paths=[rel_path],
+                        message=f"AI update: {result['file']} ({result['operation']})",
+                    )
                 )
-                print(json.dumps({"git": git_result}, indent=2), file=sys.stderr)
+                print("git: push queued (results are printed on exit)", file=sys.stderr)
 
-        except (ContentUpdateError, OllamaError, GitError, json.JSONDecodeError) as e:
+        except (ContentUpdateError, OllamaError, json.JSONDecodeError) as e:
             msg = str(e)
             print(f"Error: {msg}", file=sys.stderr)
         except Exception as e:
             print(f"Unexpected error: {e}", file=sys.stderr)
 
+    _report_git_jobs(git_jobs)
     return 0
 
 
+def _report_git_jobs(jobs: list[Future]) -> None:
+    if jobs:
+        print("Waiting for queued git pushes...", file=sys.stderr)
+    for job in jobs:
+        try:
+            git_result = job.result()
+        except GitError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            continue
+        except Exception as e:
+            print(f"Unexpected error: {e}", file=sys.stderr)
+            continue
+        print(orjson.dumps({"git": git_result}, option=orjson.OPT_INDENT_2).decode(), file=sys.stderr)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -1,21 +1,42 @@
 from __future__ import annotations
 
-import json
+import os
+import shutil
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Literal
 
-from jsonschema import ValidationError, validate
+import fastjsonschema
+import orjson
 
 from .paths import backups_root, content_root
-from .schema_loader import load_schema
+from .schema_loader import load_compiled, load_compiled_section
 
 
 AllowedFile = Literal["site.json"]
 Section = Literal["bio", "services", "projects", "contact"]
 Operation = Literal["replace", "append", "delete"]
 
+_ALLOWED_KEYS = frozenset(("file", "operation", "content"))
+_OPERATIONS = frozenset(("replace", "append", "delete"))
+_SECTIONS = frozenset(("bio", "services", "projects", "contact"))
+_ARRAY_SECTIONS = frozenset(("services", "projects"))
+_BIO_LIST_KEYS = ("summary", "highlights")
+_BIO_STR_KEYS = ("name", "title", "location")
+
+# Same layout as json.dumps(indent=2, ensure_ascii=False) plus a trailing newline.
+_JSON_WRITE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+
+# Resolved once at import; the content layout doesn't move while the process runs.
+_SITE_PATH = (content_root() / "site.json").resolve()
+_BACKUPS_ROOT_RESOLVED = backups_root().resolve()
+
+# Last known on-disk bytes per content file, keyed by _stat_key(), so a long-running
+# process (the MCP server) skips re-reading an unchanged file.
+_SITE_CACHE: dict[Path, tuple[tuple[int, int, int, int], bytes]] = {}
+
 
 @dataclass(frozen=True)
 class UpdatePayload:
@@ -55,25 +76,24 @@ def restore_backup(*, file_name: AllowedFile, backup: str | None = None) -> dict
     if not path.exists():
         raise ContentUpdateError(f"Content file does not exist: {file_name}")
 
-    available = list_backups(file_name)
-    if not available:
-        raise ContentUpdateError(f"No backups found for {file_name}")
-
     if backup is None:
-        chosen = available[0]
+        latest = _latest_backup(file_name)
+        if latest is None:
+            raise ContentUpdateError(f"No backups found for {file_name}")
+        chosen = latest
     else:
         # Only allow backup file names, not arbitrary paths.
         if Path(backup).name != backup:
             raise ContentUpdateError("backup must be a filename, not a path")
-        if not (backup.startswith(f"{file_name}.") and backup.endswith(".bak")):
+        if not _is_backup_name(file_name, backup):
             raise ContentUpdateError("backup filename does not match target file")
-        if backup not in set(available):
+        if not os.path.isfile(backups_root() / backup):
             raise ContentUpdateError("backup not found")
         chosen = backup
 
     backup_path = (backups_root() / chosen).resolve()
     # Ensure resolved path still sits inside backups_root.
-    root = backups_root().resolve()
+    root = _BACKUPS_ROOT_RESOLVED
     if backup_path != root and root not in backup_path.parents:
         raise ContentUpdateError("Refusing to access outside backups directory")
 
@@ -91,52 +111,125 @@ def restore_backup(*, file_name: AllowedFile, backup: str | None = None) -> dict
     }
 
 
+def _is_backup_name(file_name: AllowedFile, name: str) -> bool:
+    prefix = f"{file_name}."
+    return name.startswith(prefix) and name.endswith(".bak") and len(name) > len(prefix) + len(".bak")
+
+
+def _latest_backup(file_name: AllowedFile) -> str | None:
+    """Return the newest backup filename for a content file in one directory pass.
+
+    Backup names embed a sortable UTC timestamp, so the newest is the largest name.
+    """
+
+    latest: str | None = None
+    try:
+        with os.scandir(backups_root()) as entries:
+            for entry in entries:
+                name = entry.name
+                if _is_backup_name(file_name, name) and (latest is None or name > latest):
+                    latest = name
+    except FileNotFoundError:
+        return None
+    return latest
+
+
 def _allowed_path(file_name: AllowedFile) -> Path:
-    target = (content_root() / file_name).resolve()
-    root = content_root().resolve()
-    if target != root and root not in target.parents:
-        raise ContentUpdateError("Refusing to access outside content directory")
-    return target
+    # The allowlist is fixed, so there is no caller-supplied path to contain here;
+    # the backup filename in restore_backup is the only untrusted path component.
+    if file_name != "site.json":
+        raise ContentUpdateError("Invalid or unsupported file")
+    return _SITE_PATH
 
 
-def _schema_for(file_name: AllowedFile) -> dict:
+def _schema_for(file_name: AllowedFile) -> str:
     if file_name != "site.json":
         raise ContentUpdateError("Invalid or unsupported file")
-    return load_schema("site.schema.json")
+    return "site.schema.json"
 
 
 def _read_json(path: Path) -> dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return orjson.loads(path.read_bytes())
 
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
-    text = json.dumps(data, indent=2, ensure_ascii=False)
-    path.write_text(text + "\n", encoding="utf-8", newline="\n")
+    # Write a sibling temp file and swap it in: readers never see a partial file,
+    # and the previous inode stays intact for the hardlinked backup.
+    # The temp name is unique so concurrent writers (CLI and MCP server) don't
+    # clobber each other's temp file, and it is removed if anything fails.
+    raw = orjson.dumps(data, option=_JSON_WRITE_OPTIONS)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False) as f:
+        tmp = Path(f.name)
+    try:
+        tmp.write_bytes(raw)
+        # NamedTemporaryFile creates the file 0600; keep the target's permissions.
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _SITE_CACHE[path] = (_stat_key(path), raw)
+
+
+def _stat_key(path: Path) -> tuple[int, int, int, int]:
+    # The inode changes on every save through _write_json, and ctime catches
+    # same-size in-place edits that land within one coarse mtime tick.
+    st = path.stat()
+    return (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+
+def _read_raw(path: Path) -> bytes:
+    key = _stat_key(path)
+    cached = _SITE_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    raw = path.read_bytes()
+    _SITE_CACHE[path] = (key, raw)
+    return raw
 
 
 def _backup_file(path: Path) -> Path:
+    """Snapshot ``path`` into .backups.
+
+    The backup is a hardlink to the current inode, which stays unchanged because
+    _write_json replaces the file rather than writing into it. Falls back to a
+    copy where hardlinks aren't available.
+    """
+
     backups_root().mkdir(parents=True, exist_ok=True)
     stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     backup = backups_root() / f"{path.name}.{stamp}.bak"
-    backup.write_text(path.read_text(encoding="utf-8"), encoding="utf-8", newline="\n")
+    # Same-second backups overwrite, as before.
+    backup.unlink(missing_ok=True)
+    try:
+        os.link(path, backup)
+    except OSError:
+        shutil.copyfile(path, backup)
     return backup
 
 
 def _validate(file_name: AllowedFile, data: dict[str, Any]) -> None:
-    schema = _schema_for(file_name)
+    validate = load_compiled(_schema_for(file_name))
     try:
-        validate(instance=data, schema=schema)
-    except ValidationError as e:
+        validate(data)
+    except fastjsonschema.JsonSchemaException as e:
         # Surface a concise, user-facing error message.
         raise ContentUpdateError(str(e)) from e
 
 
+def _validate_section(file_name: AllowedFile, section: Section, data: Any) -> None:
+    validate = load_compiled_section(_schema_for(file_name), section)
+    try:
+        validate(data)
+    except fastjsonschema.JsonSchemaException as e:
+        raise ContentUpdateError(f"{section}: {e}") from e
+
+
 def _coerce_payload(payload: dict[str, Any]) -> UpdatePayload:
     if not isinstance(payload, dict):
         raise ContentUpdateError("Payload must be an object")
 
-    allowed_keys = {"file", "operation", "content"}
-    extra = set(payload.keys()) - allowed_keys
+    extra = payload.keys() - _ALLOWED_KEYS
     if extra:
         raise ContentUpdateError(f"Unexpected payload keys: {sorted(extra)}")
 
@@ -146,7 +239,7 @@ def _coerce_payload(payload: dict[str, Any]) -> UpdatePayload:
 
     if file_name != "site.json":
         raise ContentUpdateError("Invalid or unsupported file")
-    if operation not in {"replace", "append", "delete"}:
+    if operation not in _OPERATIONS:
         raise ContentUpdateError("Invalid operation")
     if not isinstance(content, dict):
         raise ContentUpdateError("content must be an object")
@@ -173,13 +266,22 @@ def apply_update(payload: dict[str, Any]) -> dict[str, Any]:
     if not path.exists():
         raise ContentUpdateError(f"Content file does not exist: {p.file}")
 
-    current = _read_json(path)
-    _validate(p.file, current)
-
-    updated = _apply_operation(file_name=p.file, operation=p.operation, current=current, patch=p.content)
-    _validate(p.file, updated)
+    if p.operation == "replace":
+        # The patch is the whole new file; the current content is only copied to the backup.
+        updated = p.content
+        _validate(p.file, updated)
+        backup = _backup_file(path)
+    else:
+        raw = _read_raw(path)
+        # Freshly parsed and not shared, so append/delete may mutate it in place.
+        current = orjson.loads(raw)
+        updated = _apply_operation(file_name=p.file, operation=p.operation, current=current, patch=p.content)
+        # append/delete only touch one section; the rest of the file was
+        # validated when it was last written.
+        section = p.content["section"]
+        _validate_section(p.file, section, updated[section])
+        backup = _backup_file(path)
 
-    backup = _backup_file(path)
     _write_json(path, updated)
 
     return {
@@ -197,8 +299,11 @@ def _apply_operation(
     current: dict[str, Any],
     patch: dict[str, Any],
 ) -> dict[str, Any]:
-    if operation == "replace":
-        return patch
+    """Apply an append/delete ``patch`` to ``current``.
+
+    ``current`` is owned by the caller (freshly parsed) and is mutated in place.
+    replace is handled directly by apply_update.
+    """
 
     if operation == "append":
         return _append(file_name=file_name, current=current, patch=patch)
@@ -213,29 +318,25 @@ def _append(*, file_name: AllowedFile, current: dict[str, Any], patch: dict[str,
     if file_name != "site.json":
         raise ContentUpdateError("Invalid or unsupported file")
 
-    updated = dict(current)
     section = patch.get("section")
     data = patch.get("data")
-    if section not in {"bio", "services", "projects", "contact"}:
+    if section not in _SECTIONS:
         raise ContentUpdateError("append requires 'section' (bio|services|projects|contact)")
     if not isinstance(data, dict):
         raise ContentUpdateError("append requires 'data' object")
 
     if section == "bio":
-        bio = dict(updated.get("bio", {}))
-        for key in ("summary", "highlights"):
+        bio = current.setdefault("bio", {})
+        for key in _BIO_LIST_KEYS:
             if key in data:
                 if not isinstance(data[key], list):
                     raise ContentUpdateError(f"bio append requires '{key}' as array")
-                bio[key] = list(bio.get(key, [])) + data[key]
-        for key in ("name", "title", "location"):
-            if key in data and isinstance(data[key], str):
-                bio[key] = data[key]
-        updated["bio"] = bio
-        return updated
-
-    if section in {"services", "projects"}:
-        block = dict(updated.get(section, {}))
+                bio.setdefault(key, []).extend(data[key])
+        bio |= {key: data[key] for key in _BIO_STR_KEYS if isinstance(data.get(key), str)}
+        return current
+
+    if section in _ARRAY_SECTIONS:
+        block = current.setdefault(section, {})
         array_key = "services" if section == "services" else "projects"
 
         if "intro" in data and isinstance(data["intro"], str):
@@ -246,18 +347,14 @@ def _append(*, file_name: AllowedFile, current: dict[str, Any], patch: dict[str,
         if not isinstance(data[array_key], list):
             raise ContentUpdateError(f"'{array_key}' must be an array")
 
-        block[array_key] = list(block.get(array_key, [])) + data[array_key]
-        updated[section] = block
-        return updated
+        block.setdefault(array_key, []).extend(data[array_key])
+        return current
 
     if section == "contact":
-        contact = dict(updated.get("contact", {}))
-        for key, value in data.items():
-            if not isinstance(value, str):
-                raise ContentUpdateError("contact fields must be strings")
-            contact[key] = value
-        updated["contact"] = contact
-        return updated
+        if not all(isinstance(value, str) for value in data.values()):
+            raise ContentUpdateError("contact fields must be strings")
+        current.setdefault("contact", {}).update(data)
+        return current
 
     raise ContentUpdateError("append not supported")
 
@@ -266,47 +363,44 @@ def _delete(*, file_name: AllowedFile, current: dict[str, Any], patch: dict[str,
     if file_name != "site.json":
         raise ContentUpdateError("Invalid or unsupported file")
 
-    updated = dict(current)
     section = patch.get("section")
     data = patch.get("data")
-    if section not in {"bio", "services", "projects", "contact"}:
+    if section not in _SECTIONS:
         raise ContentUpdateError("delete requires 'section' (bio|services|projects|contact)")
     if not isinstance(data, dict):
         raise ContentUpdateError("delete requires 'data' object")
 
-    if section in {"services", "projects"}:
-        block = dict(updated.get(section, {}))
+    if section in _ARRAY_SECTIONS:
+        block = current.setdefault(section, {})
         array_key = "services" if section == "services" else "projects"
 
         names: list[str] = []
         if "name" in data and isinstance(data["name"], str):
             names = [data["name"]]
         elif "names" in data and isinstance(data["names"], list) and all(isinstance(n, str) for n in data["names"]):
-            names = list(data["names"])
+            names = data["names"]
         else:
             raise ContentUpdateError("delete requires data.name (string) or data.names (string[])")
 
-        items = list(block.get(array_key, []))
-        block[array_key] = [item for item in items if not (isinstance(item, dict) and item.get("name") in set(names))]
-        updated[section] = block
-        return updated
+        name_set = frozenset(names)
+        items = block.get(array_key, [])
+        block[array_key] = [item for item in items if not (isinstance(item, dict) and item.get("name") in name_set)]
+        return current
 
     if section == "bio":
-        bio = dict(updated.get("bio", {}))
-        for key in ("summary", "highlights"):
+        bio = current.setdefault("bio", {})
+        for key in _BIO_LIST_KEYS:
             if key in data:
                 if not isinstance(data[key], list) or not all(isinstance(s, str) for s in data[key]):
                     raise ContentUpdateError(f"bio delete requires data.{key} as string[]")
-                existing = list(bio.get(key, []))
-                bio[key] = [s for s in existing if s not in set(data[key])]
-        updated["bio"] = bio
-        return updated
+                remove_set = frozenset(data[key])
+                bio[key] = [s for s in bio.get(key, []) if s not in remove_set]
+        return current
 
     if section == "contact":
-        contact = dict(updated.get("contact", {}))
+        contact = current.setdefault("contact", {})
         for key in data.keys():
             contact[key] = ""
-        updated["contact"] = contact
-        return updated
+        return current
 
     raise ContentUpdateError("delete not supported")
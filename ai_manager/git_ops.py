@@ -27,6 +27,34 @@ def _run(repo_root: str, args: list[str]) -> str:
     return (proc.stdout or "").strip()
 
 
+def _has_staged_changes(repo_root: str, paths: list[str]) -> bool:
+    """Return True if the index differs from HEAD for ``paths``.
+
+    Scoped to the given paths, so unlike ``git status`` it doesn't scan the whole
+    worktree; newly added files show up as staged additions. In a repo with no
+    commits yet, anything just staged counts as a change.
+    """
+
+    head = subprocess.run(
+        ["git", "rev-parse", "--verify", "-q", "HEAD"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+    )
+    if head.returncode != 0:
+        return True
+
+    proc = subprocess.run(
+        ["git", "diff-index", "--quiet", "--cached", "HEAD", "--"] + paths,
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode not in (0, 1):
+        raise GitError((proc.stderr or proc.stdout or "git diff-index failed").strip())
+    return proc.returncode == 1
+
+
 def stage_commit_push(*, repo_root: str, paths: Iterable[str], message: str) -> dict:
     paths = list(paths)
     if not paths:
@@ -34,8 +62,7 @@ def stage_commit_push(*, repo_root: str, paths: Iterable[str], message: str) ->
 
     _run(repo_root, ["git", "add", "--"] + paths)
 
-    status = _run(repo_root, ["git", "status", "--porcelain"]) 
-    if not status:
+    if not _has_staged_changes(repo_root, paths):
         return {"status": "noop", "detail": "No changes to commit"}
 
     _run(repo_root, ["git", "commit", "-m", message])
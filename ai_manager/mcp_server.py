@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -14,12 +15,38 @@ if str(_repo_root) not in sys.path:
     sys.path.insert(0, str(_repo_root))
 
 from ai_manager.content_updater import ContentUpdateError, apply_update, restore_backup
-from ai_manager.git_ops import GitError, stage_commit_push
+from ai_manager.git_ops import stage_commit_push
 from ai_manager.paths import repo_root
 
 
 mcp = FastMCP("ai-consultant")
 
+# Read once; the server's environment doesn't change while it runs.
+_AUTO_GIT_PUSH = os.getenv("AUTO_GIT_PUSH", "").strip().lower() in {"1", "true", "yes"}
+
+# git add/commit/push runs in the background so tool calls return right after the
+# content write. A single worker keeps git operations ordered.
+_GIT_POOL = ThreadPoolExecutor(max_workers=1)
+
+
+def _log_git_result(job: Future) -> None:
+    # stdout is the MCP stdio transport; report background git results on stderr.
+    try:
+        print(f"git: {job.result()}", file=sys.stderr)
+    except Exception as e:
+        print(f"git error: {e}", file=sys.stderr)
+
+
+def _submit_git(*, rel_path: str, message: str) -> dict[str, Any]:
+    job = _GIT_POOL.submit(
+        stage_commit_push,
+        repo_root=str(repo_root()),
+        paths=[rel_path],
+        message=message,
+    )
+    job.add_done_callback(_log_git_result)
+    return {"status": "pending"}
+
 
 def _unwrap_inspector_args(arg: dict[str, Any]) -> dict[str, Any]:
     """The MCP Inspector sends arguments shaped like {"payload": {...}}.
@@ -30,13 +57,8 @@ def _unwrap_inspector_args(arg: dict[str, Any]) -> dict[str, Any]:
       - {"payload": {"file": ..., "operation": ..., "content": ...}}
     """
 
-    if not isinstance(arg, dict):
-        return arg
-
-    if "payload" in arg and "file" not in arg and len(arg.keys()) == 1:
-        inner = arg.get("payload")
-        if isinstance(inner, dict):
-            return inner
+    if isinstance(arg, dict) and len(arg) == 1 and isinstance(arg.get("payload"), dict):
+        return arg["payload"]
 
     return arg
 
@@ -100,7 +122,8 @@ def update_website_content(payload: dict[str, Any]) -> dict[str, Any]:
 
     Git automation (optional):
       Set env AUTO_GIT_PUSH=1 to automatically git add/commit/push the changed file.
-      Commit message uses AI update prefix.
+      Commit message uses AI update prefix. The push runs in the background and the
+      result reports git status "pending".
     """
 
     try:
@@ -110,17 +133,12 @@ def update_website_content(payload: dict[str, Any]) -> dict[str, Any]:
     except Exception as e:
         return {"status": "error", "error": f"Unexpected error: {e}"}
 
-    if os.getenv("AUTO_GIT_PUSH", "").strip() in {"1", "true", "TRUE", "yes", "YES"}:
-        try:
-            rel_path = f"website/content/{result['file']}"
-            git_result = stage_commit_push(
-                repo_root=str(repo_root()),
-                paths=[rel_path],
-                message=f"AI update: {result['file']} ({result['operation']})",
-            )
-            result["git"] = git_result
-        except GitError as e:
-            result["git"] = {"status": "error", "error": str(e)}
+    if _AUTO_GIT_PUSH:
+        rel_path = f"website/content/{result['file']}"
+        result["git"] = _submit_git(
+            rel_path=rel_path,
+            message=f"AI update: {result['file']} ({result['operation']})",
+        )
 
     return result
 
@@ -141,7 +159,8 @@ def rollback_website_content(payload: dict[str, Any]) -> dict[str, Any]:
       - Creates a backup of current content before restoring
 
     Git automation (optional):
-      Set env AUTO_GIT_PUSH=1 to automatically git add/commit/push the restored file.
+      Set env AUTO_GIT_PUSH=1 to automatically git add/commit/push the restored file
+      (in the background; the result reports git status "pending").
     """
 
     payload = _unwrap_inspector_args(payload)
@@ -164,17 +183,9 @@ def rollback_website_content(payload: dict[str, Any]) -> dict[str, Any]:
     except Exception as e:
         return {"status": "error", "error": f"Unexpected error: {e}"}
 
-    if os.getenv("AUTO_GIT_PUSH", "").strip() in {"1", "true", "TRUE", "yes", "YES"}:
-        try:
-            rel_path = f"website/content/{result['file']}"
-            git_result = stage_commit_push(
-                repo_root=str(repo_root()),
-                paths=[rel_path],
-                message=f"AI rollback: {result['file']}",
-            )
-            result["git"] = git_result
-        except GitError as e:
-            result["git"] = {"status": "error", "error": str(e)}
+    if _AUTO_GIT_PUSH:
+        rel_path = f"website/content/{result['file']}"
+        result["git"] = _submit_git(rel_path=rel_path, message=f"AI rollback: {result['file']}")
 
     return result
 
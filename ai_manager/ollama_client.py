@@ -10,16 +10,32 @@ class OllamaError(RuntimeError):
     pass
 
 
+# Shared session so repeated chat() calls reuse keep-alive connections to the Ollama host.
+_SESSION = requests.Session()
+
+
 def chat(
     *,
     prompt: str,
     model: str,
     host: str = "http://localhost:11434",
+    format: str | dict[str, Any] | None = None,
+    stream: bool = False,
 ) -> str:
+    """Send a single-turn chat to Ollama and return the message content.
+
+    ``format`` is forwarded to Ollama for constrained decoding: ``"json"`` or a
+    JSON schema object.
+
+    With ``stream=True`` the response is read token by token and returned as
+    soon as the first top-level JSON object is complete, without waiting for
+    the model to finish.
+    """
+
     url = f"{host.rstrip('/')}/api/chat"
     body: dict[str, Any] = {
         "model": model,
-        "stream": False,
+        "stream": stream,
         "messages": [
             {
                 "role": "system",
@@ -31,15 +47,21 @@ def chat(
             "temperature": 0.2
         },
     }
+    if format is not None:
+        body["format"] = format
 
     try:
-        res = requests.post(url, json=body, timeout=60)
+        res = _SESSION.post(url, json=body, timeout=(10, 60), stream=stream)
     except Exception as e:
         raise OllamaError(f"Failed to connect to Ollama at {host}: {e}") from e
 
     if res.status_code != 200:
         raise OllamaError(f"Ollama HTTP {res.status_code}: {res.text[:200]}")
 
+    if stream:
+        with res:
+            return _read_streamed_object(res)
+
     data = res.json()
     message = data.get("message") or {}
     content = message.get("content")
@@ -48,6 +70,67 @@ def chat(
     return content
 
 
+def _read_streamed_object(res: requests.Response) -> str:
+    """Accumulate NDJSON chat deltas until the first JSON object closes."""
+
+    scanner = _ObjectScanner()
+    parts: list[str] = []
+    try:
+        for line in res.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if "error" in chunk:
+                raise OllamaError(f"Ollama error: {chunk['error']}")
+            delta = (chunk.get("message") or {}).get("content") or ""
+            end = scanner.feed(delta)
+            if end != -1:
+                parts.append(delta[:end])
+                break
+            parts.append(delta)
+            if chunk.get("done"):
+                break
+    except requests.RequestException as e:
+        raise OllamaError(f"Ollama stream failed: {e}") from e
+    except ValueError as e:
+        raise OllamaError(f"Invalid Ollama stream chunk: {e}") from e
+
+    content = "".join(parts)
+    if not content.strip():
+        raise OllamaError("Ollama response missing message.content")
+    return content
+
+
+class _ObjectScanner:
+    """Track brace depth across text chunks, ignoring braces inside strings."""
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+
+    def feed(self, text: str) -> int:
+        """Return the index just past the closing '}' of the top-level object, or -1."""
+
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                self.in_string = self.depth > 0
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}" and self.depth > 0:
+                self.depth -= 1
+                if self.depth == 0:
+                    return i + 1
+        return -1
+
+
 def extract_json_object(text: str) -> dict[str, Any]:
     """Extract a JSON object from model text.
 
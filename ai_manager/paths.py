@@ -1,20 +1,25 @@
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def repo_root() -> Path:
     # ai_manager/paths.py -> repo root
     return Path(__file__).resolve().parents[1]
 
 
+@cache
 def website_root() -> Path:
     return repo_root() / "website"
 
 
+@cache
 def content_root() -> Path:
     return website_root() / "content"
 
 
+@cache
 def backups_root() -> Path:
     return content_root() / ".backups"
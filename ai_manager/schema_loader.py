@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, Callable
+
+import fastjsonschema
 
 
 @lru_cache(maxsize=32)
@@ -10,3 +13,20 @@ def load_schema(schema_name: str) -> dict:
     base = Path(__file__).resolve().parent / "schemas"
     path = base / schema_name
     return json.loads(path.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=32)
+def load_compiled(schema_name: str) -> Callable[[Any], Any]:
+    """Return a compiled validator for a schema (generated once per process).
+
+    The returned callable raises fastjsonschema.JsonSchemaException on invalid data.
+    """
+
+    return fastjsonschema.compile(load_schema(schema_name))
+
+
+@lru_cache(maxsize=32)
+def load_compiled_section(schema_name: str, section: str) -> Callable[[Any], Any]:
+    """Return a compiled validator for one top-level property of an object schema."""
+
+    return fastjsonschema.compile(load_schema(schema_name)["properties"][section])